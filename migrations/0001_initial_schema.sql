@@ -0,0 +1,278 @@
+-- Baseline schema previously created by init_db() on every import.
+-- Every statement is idempotent so it can be applied to databases that
+-- were bootstrapped by the old init_db().
+
+CREATE TABLE IF NOT EXISTS donors (
+    id SERIAL PRIMARY KEY,
+    name TEXT NOT NULL,
+    email TEXT,
+    phone TEXT,
+    address TEXT,
+    donor_type TEXT,
+    notes TEXT,
+    category TEXT DEFAULT 'one-time',
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+ALTER TABLE donors ADD COLUMN IF NOT EXISTS category TEXT DEFAULT 'one-time';
+
+CREATE TABLE IF NOT EXISTS products (
+    id SERIAL PRIMARY KEY,
+    name TEXT NOT NULL,
+    type TEXT NOT NULL,
+    buying_price REAL NOT NULL,
+    selling_price REAL NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS services (
+    id SERIAL PRIMARY KEY,
+    name TEXT NOT NULL,
+    description TEXT NOT NULL,
+    price REAL NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS stock (
+    id SERIAL PRIMARY KEY,
+    product_name TEXT NOT NULL,
+    product_type TEXT NOT NULL,
+    quantity INTEGER NOT NULL,
+    price_per_unit REAL NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS bank_account (
+    id SERIAL PRIMARY KEY,
+    balance REAL NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS clients (
+    id SERIAL PRIMARY KEY,
+    name TEXT NOT NULL,
+    email TEXT NOT NULL,
+    phone TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS assets (
+    id SERIAL PRIMARY KEY,
+    name TEXT NOT NULL,
+    type TEXT NOT NULL,
+    cost_price REAL NOT NULL,
+    current_value REAL NOT NULL,
+    quantity INTEGER NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS sales (
+    id SERIAL PRIMARY KEY,
+    client_name TEXT NOT NULL,
+    items JSONB NOT NULL,
+    total_amount REAL NOT NULL,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS expenses (
+    id SERIAL PRIMARY KEY,
+    date DATE NOT NULL,
+    person TEXT NOT NULL,
+    description TEXT NOT NULL,
+    cost REAL NOT NULL,
+    quantity INTEGER NOT NULL,
+    total REAL NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS transactions (
+    id SERIAL PRIMARY KEY,
+    date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    type TEXT NOT NULL,  -- 'deposit' or 'withdraw'
+    amount REAL NOT NULL,
+    purpose TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS notifications (
+    id SERIAL PRIMARY KEY,
+    message TEXT NOT NULL,
+    type TEXT NOT NULL,  -- e.g., 'sale', 'transaction', 'stock_update'
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    is_read BOOLEAN DEFAULT FALSE  -- Track read/unread status
+);
+
+CREATE TABLE IF NOT EXISTS tasks (
+    id SERIAL PRIMARY KEY,
+    title TEXT NOT NULL,
+    content TEXT NOT NULL,
+    date TEXT NOT NULL,
+    status TEXT NOT NULL
+);
+
+-- init_db() used to drop and recreate this table on every start
+CREATE TABLE IF NOT EXISTS diary_entries (
+    id SERIAL PRIMARY KEY,
+    content TEXT NOT NULL,
+    date TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS folders (
+    id TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    parent_id TEXT REFERENCES folders(id) ON DELETE CASCADE
+);
+
+CREATE TABLE IF NOT EXISTS donations (
+    id SERIAL PRIMARY KEY,
+    donor_id INTEGER REFERENCES donors(id) ON DELETE SET NULL,
+    donor_name TEXT,
+    amount FLOAT NOT NULL,
+    payment_method TEXT NOT NULL,
+    date DATE NOT NULL,
+    project TEXT,
+    notes TEXT,
+    status TEXT DEFAULT 'completed',
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS files (
+    id TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    type TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    folder_id TEXT REFERENCES folders(id) ON DELETE CASCADE,
+    path TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS projects (
+    id SERIAL PRIMARY KEY,
+    name TEXT NOT NULL,
+    description TEXT,
+    start_date DATE NOT NULL,
+    end_date DATE NOT NULL,
+    budget REAL NOT NULL,
+    funding_source TEXT NOT NULL,
+    status TEXT NOT NULL,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS activities (
+    id SERIAL PRIMARY KEY,
+    name TEXT NOT NULL,
+    project_id INTEGER REFERENCES projects(id),
+    description TEXT,
+    start_date DATE NOT NULL,
+    end_date DATE NOT NULL,
+    budget REAL NOT NULL,
+    status TEXT NOT NULL,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS budget_items (
+    id SERIAL PRIMARY KEY,
+    project_id INTEGER NOT NULL REFERENCES projects(id) ON DELETE CASCADE,
+    activity_id INTEGER REFERENCES activities(id) ON DELETE CASCADE,
+    item_name TEXT NOT NULL,
+    description TEXT,
+    quantity REAL NOT NULL,
+    unit_price REAL NOT NULL,
+    total REAL GENERATED ALWAYS AS (quantity * unit_price) STORED,
+    category TEXT NOT NULL,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS employees (
+    id SERIAL PRIMARY KEY,
+    name TEXT NOT NULL,
+    nin TEXT NOT NULL UNIQUE,
+    dob DATE NOT NULL,
+    qualification TEXT NOT NULL,
+    email TEXT,
+    phone TEXT,
+    address TEXT,
+    status TEXT NOT NULL DEFAULT 'active',
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS deployments (
+    id SERIAL PRIMARY KEY,
+    employee_id INTEGER NOT NULL REFERENCES employees(id) ON DELETE CASCADE,
+    activity_id INTEGER NOT NULL REFERENCES activities(id) ON DELETE CASCADE,
+    role TEXT NOT NULL,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS work_opportunities (
+    id SERIAL PRIMARY KEY,
+    title TEXT NOT NULL,
+    description TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'open',
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS opportunity_assignments (
+    id SERIAL PRIMARY KEY,
+    opportunity_id INTEGER NOT NULL REFERENCES work_opportunities(id) ON DELETE CASCADE,
+    employee_id INTEGER NOT NULL REFERENCES employees(id) ON DELETE CASCADE,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS payments (
+    id SERIAL PRIMARY KEY,
+    employee_id INTEGER NOT NULL REFERENCES employees(id),
+    amount DECIMAL(12, 2) NOT NULL,
+    payment_period VARCHAR(7) NOT NULL,  -- Format: YYYY-MM
+    description TEXT,
+    payment_method VARCHAR(20) NOT NULL,
+    status VARCHAR(10) NOT NULL DEFAULT 'pending',  -- pending, approved, rejected
+    remarks TEXT,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    approved_at TIMESTAMP,
+    processed_by INTEGER REFERENCES employees(id)
+);
+
+CREATE TABLE IF NOT EXISTS reports (
+    id SERIAL PRIMARY KEY,
+    employee_id INTEGER REFERENCES employees(id),
+    activity_id INTEGER REFERENCES activities(id),
+    title TEXT NOT NULL,
+    content TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'submitted',
+    submitted_by INTEGER REFERENCES employees(id),
+    approved_by INTEGER REFERENCES employees(id),
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS report_attachments (
+    id SERIAL PRIMARY KEY,
+    report_id INTEGER REFERENCES reports(id) ON DELETE CASCADE,
+    original_filename TEXT NOT NULL,
+    stored_filename TEXT NOT NULL,
+    file_type TEXT NOT NULL,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS program_areas (
+    id SERIAL PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE,
+    budget FLOAT DEFAULT 0,
+    balance FLOAT DEFAULT 0
+);
+
+CREATE TABLE IF NOT EXISTS bank_accounts (
+    id SERIAL PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE,
+    account_number TEXT NOT NULL,
+    balance FLOAT DEFAULT 0
+);
+
+-- Seed data
+INSERT INTO program_areas (name, budget) VALUES
+    ('Main Account', 0),
+    ('Women Empowerment', 0),
+    ('Vocational Education', 0),
+    ('Climate Change', 0),
+    ('Reproductive Health', 0)
+ON CONFLICT (name) DO NOTHING;
+
+INSERT INTO bank_accounts (name, account_number, balance)
+VALUES ('Main Account', '****5580', 0)
+ON CONFLICT (name) DO NOTHING;
+
+INSERT INTO folders (id, name) VALUES ('root', 'Fundraising Documents')
+ON CONFLICT (id) DO NOTHING;
+
+INSERT INTO bank_account (balance)
+SELECT 0 WHERE NOT EXISTS (SELECT 1 FROM bank_account);
@@ -0,0 +1,28 @@
+-- Indexes for the filter, sort and join columns used by the routes.
+
+CREATE INDEX IF NOT EXISTS idx_stock_product ON stock (product_name, product_type);
+CREATE INDEX IF NOT EXISTS idx_products_name_type ON products (name, type);
+
+CREATE INDEX IF NOT EXISTS idx_sales_created_at ON sales (created_at, id);
+
+CREATE INDEX IF NOT EXISTS idx_notifications_created_at ON notifications (created_at, id);
+CREATE INDEX IF NOT EXISTS idx_notifications_unread ON notifications (id) WHERE is_read = FALSE;
+
+CREATE INDEX IF NOT EXISTS idx_donations_donor_id ON donations (donor_id);
+CREATE INDEX IF NOT EXISTS idx_donations_date ON donations (date, id);
+
+CREATE INDEX IF NOT EXISTS idx_payments_status_created_at ON payments (status, created_at);
+CREATE INDEX IF NOT EXISTS idx_payments_created_at ON payments (created_at, id);
+CREATE INDEX IF NOT EXISTS idx_payments_pending ON payments (created_at) WHERE status = 'pending';
+CREATE INDEX IF NOT EXISTS idx_payments_employee_id ON payments (employee_id, created_at);
+
+CREATE INDEX IF NOT EXISTS idx_reports_status_created_at ON reports (status, created_at);
+CREATE INDEX IF NOT EXISTS idx_reports_activity_id ON reports (activity_id, created_at);
+CREATE INDEX IF NOT EXISTS idx_reports_created_at ON reports (created_at, id);
+CREATE INDEX IF NOT EXISTS idx_report_attachments_report_id ON report_attachments (report_id);
+
+CREATE INDEX IF NOT EXISTS idx_files_folder_id ON files (folder_id);
+CREATE INDEX IF NOT EXISTS idx_folders_parent_id ON folders (parent_id);
+
+CREATE INDEX IF NOT EXISTS idx_budget_items_activity_id ON budget_items (activity_id, created_at);
+CREATE INDEX IF NOT EXISTS idx_budget_items_project_id ON budget_items (project_id, created_at);
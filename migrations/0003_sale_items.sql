@@ -0,0 +1,20 @@
+-- Typed sale line items. sales.items (JSONB) is still written for the
+-- existing read endpoints; run `python main.py backfill-sale-items` once
+-- after this migration to convert sales recorded before it.
+
+CREATE TABLE IF NOT EXISTS sale_items (
+    id SERIAL PRIMARY KEY,
+    sale_id INTEGER NOT NULL REFERENCES sales(id) ON DELETE CASCADE,
+    product_id INTEGER REFERENCES products(id) ON DELETE SET NULL,
+    item_name TEXT NOT NULL,
+    item_type TEXT NOT NULL,  -- 'product' or 'service'
+    quantity INTEGER NOT NULL,
+    unit_price REAL NOT NULL,
+    total REAL NOT NULL,
+    buying_price REAL  -- products.buying_price at the time of sale, NULL for services
+);
+
+CREATE INDEX IF NOT EXISTS idx_sale_items_sale_id ON sale_items (sale_id);
+CREATE INDEX IF NOT EXISTS idx_sale_items_product_id ON sale_items (product_id);
+-- Lets the COGS aggregate run as an index-only scan
+CREATE INDEX IF NOT EXISTS idx_sale_items_cogs ON sale_items (item_type) INCLUDE (quantity, unit_price, buying_price);
@@ -0,0 +1,24 @@
+-- Running totals behind /net_profit/, /gross_profit/, /total_stock/ and
+-- /total_investment/. Write endpoints apply deltas in their own
+-- transaction; `python main.py reconcile-rollup --fix` re-seeds it from a
+-- full recomputation (run it after backfill-sale-items on existing data).
+
+CREATE TABLE IF NOT EXISTS financial_rollup (
+    metric TEXT PRIMARY KEY,
+    value DOUBLE PRECISION NOT NULL DEFAULT 0,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+INSERT INTO financial_rollup (metric, value) VALUES
+    ('revenue', (SELECT COALESCE(SUM(total_amount), 0) FROM sales)),
+    ('cogs', (
+        SELECT COALESCE(SUM(CASE
+            WHEN item_type = 'product' THEN quantity * buying_price
+            WHEN item_type = 'service' THEN quantity * unit_price * 0.5
+        END), 0)
+        FROM sale_items
+    )),
+    ('expenses', (SELECT COALESCE(SUM(total), 0) FROM expenses)),
+    ('stock_value', (SELECT COALESCE(SUM(quantity * price_per_unit), 0) FROM stock)),
+    ('asset_value', (SELECT COALESCE(SUM(cost_price * quantity), 0) FROM assets))
+ON CONFLICT (metric) DO NOTHING;
@@ -0,0 +1,24 @@
+-- Per-day sales aggregate behind /sales/timeseries. create_sale, the sale
+-- delete endpoint and backfill-sale-items keep it current.
+
+CREATE TABLE IF NOT EXISTS sales_daily (
+    day DATE PRIMARY KEY,
+    revenue DOUBLE PRECISION NOT NULL DEFAULT 0,
+    sale_count INTEGER NOT NULL DEFAULT 0,
+    cogs DOUBLE PRECISION NOT NULL DEFAULT 0
+);
+
+INSERT INTO sales_daily (day, revenue, sale_count, cogs)
+SELECT s.created_at::date, SUM(s.total_amount), COUNT(*), COALESCE(SUM(c.cogs), 0)
+FROM sales s
+LEFT JOIN (
+    SELECT sale_id, COALESCE(SUM(CASE
+        WHEN item_type = 'product' THEN quantity * buying_price
+        WHEN item_type = 'service' THEN quantity * unit_price * 0.5
+    END), 0) AS cogs
+    FROM sale_items
+    GROUP BY sale_id
+) c ON c.sale_id = s.id
+GROUP BY s.created_at::date
+ON CONFLICT (day) DO UPDATE
+SET revenue = EXCLUDED.revenue, sale_count = EXCLUDED.sale_count, cogs = EXCLUDED.cogs;
@@ -0,0 +1,9 @@
+-- Sort indexes for the keyset-paginated list endpoints that 0002 did not cover.
+
+CREATE INDEX IF NOT EXISTS idx_expenses_date ON expenses (date, id);
+CREATE INDEX IF NOT EXISTS idx_transactions_date ON transactions (date, id);
+CREATE INDEX IF NOT EXISTS idx_donors_name ON donors (name, id);
+
+-- /payments/history?status= pages on (created_at, id) within one status
+DROP INDEX IF EXISTS idx_payments_status_created_at;
+CREATE INDEX IF NOT EXISTS idx_payments_status_created_at_id ON payments (status, created_at, id);
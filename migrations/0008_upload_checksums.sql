@@ -0,0 +1,7 @@
+-- SHA-256 of stored uploads, computed while streaming them to disk.
+
+ALTER TABLE files ADD COLUMN IF NOT EXISTS sha256 TEXT;
+ALTER TABLE files ALTER COLUMN size TYPE BIGINT;
+
+ALTER TABLE report_attachments ADD COLUMN IF NOT EXISTS sha256 TEXT;
+ALTER TABLE report_attachments ADD COLUMN IF NOT EXISTS size BIGINT;
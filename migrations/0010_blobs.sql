@@ -0,0 +1,47 @@
+-- Content-addressed blob store. files and report_attachments rows point at a blob by
+-- SHA-256; triggers keep blobs.ref_count in step, including cascaded deletes.
+
+CREATE TABLE IF NOT EXISTS blobs (
+    sha256 TEXT PRIMARY KEY,
+    size BIGINT NOT NULL,
+    path TEXT NOT NULL,
+    ref_count INTEGER NOT NULL DEFAULT 0,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    unreferenced_since TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE INDEX IF NOT EXISTS idx_blobs_unreferenced ON blobs (unreferenced_since) WHERE ref_count = 0;
+
+-- NULL for uploads stored before the blob store; `python main.py backfill-blobs` moves them in
+ALTER TABLE files ADD COLUMN IF NOT EXISTS blob_sha256 TEXT REFERENCES blobs(sha256);
+ALTER TABLE report_attachments ADD COLUMN IF NOT EXISTS blob_sha256 TEXT REFERENCES blobs(sha256);
+
+CREATE INDEX IF NOT EXISTS idx_files_blob_sha256 ON files (blob_sha256);
+CREATE INDEX IF NOT EXISTS idx_report_attachments_blob_sha256 ON report_attachments (blob_sha256);
+
+CREATE OR REPLACE FUNCTION track_blob_refs() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') AND OLD.blob_sha256 IS NOT NULL THEN
+        UPDATE blobs
+        SET ref_count = ref_count - 1,
+            unreferenced_since = CASE WHEN ref_count = 1 THEN CURRENT_TIMESTAMP ELSE unreferenced_since END
+        WHERE sha256 = OLD.blob_sha256;
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') AND NEW.blob_sha256 IS NOT NULL THEN
+        UPDATE blobs
+        SET ref_count = ref_count + 1, unreferenced_since = NULL
+        WHERE sha256 = NEW.blob_sha256;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS files_blob_refs ON files;
+CREATE TRIGGER files_blob_refs
+    AFTER INSERT OR DELETE OR UPDATE OF blob_sha256 ON files
+    FOR EACH ROW EXECUTE FUNCTION track_blob_refs();
+
+DROP TRIGGER IF EXISTS report_attachments_blob_refs ON report_attachments;
+CREATE TRIGGER report_attachments_blob_refs
+    AFTER INSERT OR DELETE OR UPDATE OF blob_sha256 ON report_attachments
+    FOR EACH ROW EXECUTE FUNCTION track_blob_refs();
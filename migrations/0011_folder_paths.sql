@@ -0,0 +1,63 @@
+-- Materialized folder paths: '/<root id>/.../<id>/' plus depth, kept current by triggers,
+-- so subtree, move and breadcrumb queries are prefix scans instead of per-level recursion.
+
+ALTER TABLE folders ADD COLUMN IF NOT EXISTS path TEXT;
+ALTER TABLE folders ADD COLUMN IF NOT EXISTS depth INTEGER;
+
+WITH RECURSIVE tree AS (
+    SELECT id, '/' || id || '/' AS path, 0 AS depth
+    FROM folders WHERE parent_id IS NULL
+    UNION ALL
+    SELECT f.id, t.path || f.id || '/', t.depth + 1
+    FROM folders f JOIN tree t ON f.parent_id = t.id
+)
+UPDATE folders SET path = tree.path, depth = tree.depth
+FROM tree WHERE folders.id = tree.id;
+
+ALTER TABLE folders ALTER COLUMN path SET NOT NULL;
+ALTER TABLE folders ALTER COLUMN depth SET NOT NULL;
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_folders_path ON folders (path text_pattern_ops);
+
+CREATE OR REPLACE FUNCTION set_folder_path() RETURNS trigger AS $$
+DECLARE
+    parent_path TEXT;
+    parent_depth INTEGER;
+BEGIN
+    IF NEW.parent_id IS NULL THEN
+        NEW.path := '/' || NEW.id || '/';
+        NEW.depth := 0;
+    ELSE
+        SELECT path, depth INTO parent_path, parent_depth FROM folders WHERE id = NEW.parent_id;
+        IF TG_OP = 'UPDATE' AND parent_path LIKE OLD.path || '%' THEN
+            RAISE EXCEPTION 'cannot move folder % into its own subtree', NEW.id
+                USING ERRCODE = 'check_violation';
+        END IF;
+        NEW.path := parent_path || NEW.id || '/';
+        NEW.depth := parent_depth + 1;
+    END IF;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION move_folder_subtree() RETURNS trigger AS $$
+BEGIN
+    IF NEW.path <> OLD.path THEN
+        UPDATE folders
+        SET path = NEW.path || substr(path, length(OLD.path) + 1),
+            depth = depth + (NEW.depth - OLD.depth)
+        WHERE path LIKE OLD.path || '%' AND id <> NEW.id;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS folders_set_path ON folders;
+CREATE TRIGGER folders_set_path
+    BEFORE INSERT OR UPDATE OF parent_id ON folders
+    FOR EACH ROW EXECUTE FUNCTION set_folder_path();
+
+DROP TRIGGER IF EXISTS folders_move_subtree ON folders;
+CREATE TRIGGER folders_move_subtree
+    AFTER UPDATE OF parent_id ON folders
+    FOR EACH ROW EXECUTE FUNCTION move_folder_subtree();
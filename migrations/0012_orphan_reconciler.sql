@@ -0,0 +1,13 @@
+-- Checkpoints for resumable maintenance scans, and the lookups the orphan-file
+-- reconciler runs against every stored path.
+
+CREATE TABLE IF NOT EXISTS maintenance_checkpoints (
+    name TEXT PRIMARY KEY,
+    position TEXT NOT NULL DEFAULT '',
+    stats JSONB,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE INDEX IF NOT EXISTS idx_files_path ON files (path);
+CREATE INDEX IF NOT EXISTS idx_report_attachments_stored_filename ON report_attachments (stored_filename);
+CREATE INDEX IF NOT EXISTS idx_blobs_path ON blobs (path);
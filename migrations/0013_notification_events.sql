@@ -0,0 +1,67 @@
+-- Publish notification changes on the 'notifications' channel. Statement-level
+-- triggers send one NOTIFY per statement (so mark-as-read on thousands of rows is one
+-- event), delivered at commit. Payloads carry the unread delta so listeners can keep
+-- a running counter, and stay under the 8000 byte NOTIFY limit by capping the rows
+-- and message length they include.
+
+CREATE OR REPLACE FUNCTION publish_notification_changes() RETURNS trigger AS $$
+DECLARE
+    payload JSONB;
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        SELECT jsonb_build_object(
+            'event', 'created',
+            'count', COUNT(*),
+            'unread_delta', COUNT(*) FILTER (WHERE is_read = FALSE),
+            'notifications', (
+                SELECT COALESCE(jsonb_agg(n ORDER BY n.id), '[]'::jsonb)
+                FROM (
+                    SELECT id, left(message, 400) AS message, type, created_at, is_read
+                    FROM new_rows ORDER BY id LIMIT 10
+                ) n
+            )
+        ) INTO payload
+        FROM new_rows;
+    ELSIF TG_OP = 'UPDATE' THEN
+        SELECT jsonb_build_object(
+            'event', 'updated',
+            'count', (SELECT COUNT(*) FROM new_rows),
+            'unread_delta', (SELECT COUNT(*) FROM new_rows WHERE is_read = FALSE)
+                          - (SELECT COUNT(*) FROM old_rows WHERE is_read = FALSE)
+        ) INTO payload;
+    ELSE
+        SELECT jsonb_build_object(
+            'event', 'deleted',
+            'count', COUNT(*),
+            'unread_delta', -COUNT(*) FILTER (WHERE is_read = FALSE)
+        ) INTO payload
+        FROM old_rows;
+    END IF;
+
+    IF (payload->>'count')::int > 0 THEN
+        -- Listeners compare xid with the snapshot their unread count was seeded from
+        payload := payload || jsonb_build_object('xid', txid_current());
+        PERFORM pg_notify('notifications', payload::text);
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Transition tables allow only one event per trigger
+DROP TRIGGER IF EXISTS notifications_publish_insert ON notifications;
+CREATE TRIGGER notifications_publish_insert
+    AFTER INSERT ON notifications
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION publish_notification_changes();
+
+DROP TRIGGER IF EXISTS notifications_publish_update ON notifications;
+CREATE TRIGGER notifications_publish_update
+    AFTER UPDATE ON notifications
+    REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION publish_notification_changes();
+
+DROP TRIGGER IF EXISTS notifications_publish_delete ON notifications;
+CREATE TRIGGER notifications_publish_delete
+    AFTER DELETE ON notifications
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION publish_notification_changes();
@@ -0,0 +1,31 @@
+-- Read notifications older than the retention window move to notifications_archive in
+-- batches (see archive_read_notifications in main.py), keeping the hot table small.
+-- An archive table rather than partitioning: the notifications primary key and the
+-- keyset index would have to include created_at, and the table would need a rewrite.
+
+CREATE TABLE IF NOT EXISTS notifications_archive (
+    id INTEGER PRIMARY KEY,
+    message TEXT NOT NULL,
+    type TEXT NOT NULL,
+    created_at TIMESTAMP,
+    is_read BOOLEAN,
+    archived_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE INDEX IF NOT EXISTS idx_notifications_archive_created_at ON notifications_archive (created_at, id);
+
+-- Per-reader "read up to" watermark; every notification with id <= last_read_id is read
+CREATE TABLE IF NOT EXISTS notification_read_marks (
+    reader TEXT PRIMARY KEY,
+    last_read_id INTEGER NOT NULL DEFAULT 0,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Seed the shared reader from the existing flags: read up to the first unread row
+INSERT INTO notification_read_marks (reader, last_read_id)
+SELECT 'default', COALESCE(
+    (SELECT MIN(id) - 1 FROM notifications WHERE is_read = FALSE),
+    (SELECT MAX(id) FROM notifications),
+    0
+)
+ON CONFLICT (reader) DO NOTHING;
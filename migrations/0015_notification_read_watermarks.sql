@@ -0,0 +1,71 @@
+-- Read state now lives only in notification_read_marks: a notification is unread for a
+-- reader while id > last_read_id, so unread counts are primary key range counts and
+-- mark-as-read is a single-row upsert. is_read is no longer written.
+
+-- Change events now carry the id range they touched, so listeners can tell which
+-- readers' cached counts an event moves
+CREATE OR REPLACE FUNCTION publish_notification_changes() RETURNS trigger AS $$
+DECLARE
+    payload JSONB;
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        SELECT jsonb_build_object(
+            'event', 'created',
+            'count', COUNT(*),
+            'min_id', MIN(id),
+            'max_id', MAX(id),
+            'notifications', (
+                SELECT COALESCE(jsonb_agg(n ORDER BY n.id), '[]'::jsonb)
+                FROM (
+                    SELECT id, left(message, 400) AS message, type, created_at
+                    FROM new_rows ORDER BY id LIMIT 10
+                ) n
+            )
+        ) INTO payload
+        FROM new_rows;
+    ELSIF TG_OP = 'UPDATE' THEN
+        SELECT jsonb_build_object(
+            'event', 'updated',
+            'count', COUNT(*),
+            'min_id', MIN(id),
+            'max_id', MAX(id)
+        ) INTO payload
+        FROM new_rows;
+    ELSE
+        SELECT jsonb_build_object(
+            'event', 'deleted',
+            'count', COUNT(*),
+            'min_id', MIN(id),
+            'max_id', MAX(id)
+        ) INTO payload
+        FROM old_rows;
+    END IF;
+
+    IF (payload->>'count')::int > 0 THEN
+        -- Listeners compare xid with the snapshot their unread count was taken from
+        payload := payload || jsonb_build_object('xid', txid_current());
+        PERFORM pg_notify('notifications', payload::text);
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION publish_read_mark_changes() RETURNS trigger AS $$
+BEGIN
+    PERFORM pg_notify('notifications', jsonb_build_object(
+        'event', 'read',
+        'reader', NEW.reader,
+        'last_read_id', NEW.last_read_id,
+        'xid', txid_current()
+    )::text);
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS notification_read_marks_publish ON notification_read_marks;
+CREATE TRIGGER notification_read_marks_publish
+    AFTER INSERT OR UPDATE OF last_read_id ON notification_read_marks
+    FOR EACH ROW EXECUTE FUNCTION publish_read_mark_changes();
+
+-- Every row keeps is_read = FALSE from here on, so the partial index would cover the table
+DROP INDEX IF EXISTS idx_notifications_unread;
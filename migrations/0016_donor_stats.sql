@@ -0,0 +1,32 @@
+-- Per-donor donation summary behind /donors/, /donors/{id} and /donors/stats/.
+-- create_donation and delete_donation keep it current; donations are matched to
+-- donors by donations.donor_id, never by name.
+
+-- Link donations recorded by name only, where the name identifies exactly one donor
+UPDATE donations dn
+SET donor_id = d.id
+FROM (
+    SELECT name, MIN(id) AS id FROM donors GROUP BY name HAVING COUNT(*) = 1
+) d
+WHERE dn.donor_id IS NULL AND dn.donor_name = d.name;
+
+CREATE TABLE IF NOT EXISTS donor_stats (
+    donor_id INTEGER PRIMARY KEY REFERENCES donors(id) ON DELETE CASCADE,
+    donation_count INTEGER NOT NULL DEFAULT 0,
+    total_donated DOUBLE PRECISION NOT NULL DEFAULT 0,
+    first_donation DATE,
+    last_donation DATE
+);
+
+INSERT INTO donor_stats (donor_id, donation_count, total_donated, first_donation, last_donation)
+SELECT donor_id, COUNT(*), SUM(amount), MIN(date), MAX(date)
+FROM donations
+WHERE donor_id IS NOT NULL
+GROUP BY donor_id
+ON CONFLICT (donor_id) DO UPDATE
+SET donation_count = EXCLUDED.donation_count, total_donated = EXCLUDED.total_donated,
+    first_donation = EXCLUDED.first_donation, last_donation = EXCLUDED.last_donation;
+
+-- A donor's donations newest first, and the first/last date recomputed on delete
+CREATE INDEX IF NOT EXISTS idx_donations_donor_date ON donations (donor_id, date, id);
+DROP INDEX IF EXISTS idx_donations_donor_id;
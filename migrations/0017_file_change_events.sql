@@ -0,0 +1,14 @@
+-- Publish the id of every updated or deleted file, including rows removed by a folder
+-- delete cascade, so each worker can drop it from its in-process file metadata cache.
+
+CREATE OR REPLACE FUNCTION publish_file_changes() RETURNS trigger AS $$
+BEGIN
+    PERFORM pg_notify('file_changes', OLD.id);
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS files_publish_changes ON files;
+CREATE TRIGGER files_publish_changes
+    AFTER UPDATE OR DELETE ON files
+    FOR EACH ROW EXECUTE FUNCTION publish_file_changes();
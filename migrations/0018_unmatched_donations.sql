@@ -0,0 +1,4 @@
+-- Donations recorded under a name with no (or no unique) donor yet. create_donor and a
+-- donor rename link them by name, so they reach donor_stats once the donor exists.
+
+CREATE INDEX IF NOT EXISTS idx_donations_unmatched_name ON donations (donor_name) WHERE donor_id IS NULL;
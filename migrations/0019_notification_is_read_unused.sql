@@ -0,0 +1,7 @@
+-- notifications.is_read has not been written since 0015: read state is the reader's
+-- watermark in notification_read_marks, and POST /notifications/ rejects is_read = true.
+-- The unread_delta field the 0013 triggers sent was replaced by min_id/max_id in 0015;
+-- nothing reads it. The column stays for the archive copy and older readers of the table.
+
+COMMENT ON COLUMN notifications.is_read IS
+    'Unused since 0015; a notification is read when id <= notification_read_marks.last_read_id';
@@ -0,0 +1,30 @@
+-- Serialize folder tree writes. set_folder_path() read the parent's path without a lock,
+-- so a child inserted under a folder while an ancestor was being moved could keep the old
+-- prefix, or be missed by folders_move_subtree, and drop out of every prefix scan.
+-- create_folder and move_folder take this lock first (lock_folder_tree in main.py); the
+-- trigger takes it too for any other writer. Under READ COMMITTED each statement in the
+-- function gets a fresh snapshot, so the parent path is read after the lock is held.
+
+CREATE OR REPLACE FUNCTION set_folder_path() RETURNS trigger AS $$
+DECLARE
+    parent_path TEXT;
+    parent_depth INTEGER;
+BEGIN
+    IF TG_OP = 'UPDATE' OR NEW.parent_id IS NOT NULL THEN
+        PERFORM pg_advisory_xact_lock(7315002);  -- FOLDER_TREE_LOCK_ID
+    END IF;
+    IF NEW.parent_id IS NULL THEN
+        NEW.path := '/' || NEW.id || '/';
+        NEW.depth := 0;
+    ELSE
+        SELECT path, depth INTO parent_path, parent_depth FROM folders WHERE id = NEW.parent_id;
+        IF TG_OP = 'UPDATE' AND parent_path LIKE OLD.path || '%' THEN
+            RAISE EXCEPTION 'cannot move folder % into its own subtree', NEW.id
+                USING ERRCODE = 'check_violation';
+        END IF;
+        NEW.path := parent_path || NEW.id || '/';
+        NEW.depth := parent_depth + 1;
+    END IF;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
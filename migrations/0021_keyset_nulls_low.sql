@@ -0,0 +1,26 @@
+-- Keyset pages on nullable timestamp columns sort on COALESCE(column, '-infinity')
+-- (nulls_low in main.py), so NULL rows come last and a page ending on one still has a
+-- cursor. These expression indexes replace the plain (column, id) sort indexes.
+-- idx_sales_created_at and idx_notifications_created_at stay for the ?date= range and
+-- the retention scan.
+
+CREATE INDEX IF NOT EXISTS idx_sales_created_at_keyset
+    ON sales ((COALESCE(created_at, '-infinity'::timestamp)), id);
+CREATE INDEX IF NOT EXISTS idx_notifications_created_at_keyset
+    ON notifications ((COALESCE(created_at, '-infinity'::timestamp)), id);
+CREATE INDEX IF NOT EXISTS idx_notifications_archive_created_at_keyset
+    ON notifications_archive ((COALESCE(created_at, '-infinity'::timestamp)), id);
+CREATE INDEX IF NOT EXISTS idx_transactions_date_keyset
+    ON transactions ((COALESCE(date, '-infinity'::timestamp)), id);
+CREATE INDEX IF NOT EXISTS idx_payments_created_at_keyset
+    ON payments ((COALESCE(created_at, '-infinity'::timestamp)), id);
+CREATE INDEX IF NOT EXISTS idx_payments_status_created_at_keyset
+    ON payments (status, (COALESCE(created_at, '-infinity'::timestamp)), id);
+CREATE INDEX IF NOT EXISTS idx_reports_created_at_keyset
+    ON reports ((COALESCE(created_at, '-infinity'::timestamp)), id);
+
+DROP INDEX IF EXISTS idx_notifications_archive_created_at;
+DROP INDEX IF EXISTS idx_transactions_date;
+DROP INDEX IF EXISTS idx_payments_created_at;
+DROP INDEX IF EXISTS idx_payments_status_created_at_id;
+DROP INDEX IF EXISTS idx_reports_created_at;
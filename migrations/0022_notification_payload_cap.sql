@@ -0,0 +1,53 @@
+-- pg_notify fails the writer's transaction for payloads of 8000 bytes or more. left()
+-- counts characters, not bytes, and type was not truncated, so a long type or a batch of
+-- multi-byte messages could abort a sale. Truncate type too, measure the payload in
+-- bytes, and drop the notifications sample when it would not fit; listeners refetch.
+
+CREATE OR REPLACE FUNCTION publish_notification_changes() RETURNS trigger AS $$
+DECLARE
+    payload JSONB;
+    sample JSONB;
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        SELECT jsonb_build_object(
+            'event', 'created',
+            'count', COUNT(*),
+            'min_id', MIN(id),
+            'max_id', MAX(id)
+        ) INTO payload
+        FROM new_rows;
+        SELECT COALESCE(jsonb_agg(n ORDER BY n.id), '[]'::jsonb) INTO sample
+        FROM (
+            SELECT id, left(message, 400) AS message, left(type, 100) AS type, created_at
+            FROM new_rows ORDER BY id LIMIT 10
+        ) n;
+    ELSIF TG_OP = 'UPDATE' THEN
+        SELECT jsonb_build_object(
+            'event', 'updated',
+            'count', COUNT(*),
+            'min_id', MIN(id),
+            'max_id', MAX(id)
+        ) INTO payload
+        FROM new_rows;
+    ELSE
+        SELECT jsonb_build_object(
+            'event', 'deleted',
+            'count', COUNT(*),
+            'min_id', MIN(id),
+            'max_id', MAX(id)
+        ) INTO payload
+        FROM old_rows;
+    END IF;
+
+    IF (payload->>'count')::int > 0 THEN
+        -- Listeners compare xid with the snapshot their unread count was taken from
+        payload := payload || jsonb_build_object('xid', txid_current());
+        IF sample IS NOT NULL
+           AND octet_length((payload || jsonb_build_object('notifications', sample))::text) < 8000 THEN
+            payload := payload || jsonb_build_object('notifications', sample);
+        END IF;
+        PERFORM pg_notify('notifications', payload::text);
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
@@ -0,0 +1,5 @@
+import os
+import sys
+
+# main.py sits at the repository root, as the tools/ scripts also assume
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
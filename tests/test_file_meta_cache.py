@@ -0,0 +1,56 @@
+import pytest
+
+import main
+
+ROW = ("report.pdf", "/uploads/blobs/ab/cd/abcd", "application/pdf", "abcd")
+
+class FakeConnection:
+    def __init__(self, on_query=None):
+        self.queries = 0
+        self.on_query = on_query
+
+    def cursor(self):
+        return self
+
+    def execute(self, query, params):
+        self.queries += 1
+        if self.on_query:
+            self.on_query()
+
+    def fetchone(self):
+        return ROW
+
+    def close(self):
+        pass
+
+@pytest.fixture
+def db(monkeypatch):
+    conn = FakeConnection()
+    monkeypatch.setattr(main, "get_db", lambda: conn)
+    main.set_file_meta_cache_live(True)
+    yield conn
+    main.set_file_meta_cache_live(False)
+
+def test_cached_while_listener_is_live(db):
+    assert main.get_file_meta("f1") == ROW
+    assert main.get_file_meta("f1") == ROW
+    assert db.queries == 1
+
+def test_not_cached_without_listener(db):
+    main.set_file_meta_cache_live(False)
+    main.get_file_meta("f1")
+    main.get_file_meta("f1")
+    assert db.queries == 2
+
+def test_change_notification_drops_entry(db):
+    main.get_file_meta("f1")
+    main._on_file_change(None, 0, main.FILE_CHANGES_CHANNEL, "f1")
+    main.get_file_meta("f1")
+    assert db.queries == 2
+
+def test_change_during_read_is_not_cached_over(db):
+    db.on_query = lambda: main.forget_file_meta("f1")
+    main.get_file_meta("f1")
+    db.on_query = None
+    main.get_file_meta("f1")
+    assert db.queries == 2
@@ -0,0 +1,53 @@
+from fastapi.testclient import TestClient
+
+import main
+
+class FakeConnection:
+    def __init__(self):
+        self.statements = []
+        self.params = []
+
+    def cursor(self):
+        return self
+
+    def execute(self, query, params=None):
+        self.statements.append(" ".join(query.split()))
+        self.params.append(params)
+
+    def fetchone(self):
+        last = self.statements[-1]
+        if last.startswith("SELECT path, depth"):
+            return ("/" + self.params[-1][0] + "/", 0)
+        return ("x", "name", "b", "/b/x/")
+
+    def fetchall(self):
+        return []
+
+    def commit(self):
+        pass
+
+    def rollback(self):
+        pass
+
+    def close(self):
+        pass
+
+def call(monkeypatch, method, url, **kwargs):
+    conn = FakeConnection()
+    monkeypatch.setattr(main, "get_db", lambda: conn)
+    response = TestClient(main.app).request(method, url, **kwargs)
+    return response, conn.statements
+
+def test_move_and_child_insert_take_the_tree_lock_first(monkeypatch):
+    # A child inserted while its ancestor moves must wait for the move to commit
+    moved, move_statements = call(monkeypatch, "PUT", "/folders/a/move", data={"parent_id": "b"})
+    created, create_statements = call(monkeypatch, "POST", "/folders/", json={"name": "c", "parent_id": "b"})
+    assert moved.status_code == 200 and created.status_code == 200
+    for statements in (move_statements, create_statements):
+        assert statements[0] == "SELECT pg_advisory_xact_lock(%s)"
+        assert any("folders" in statement for statement in statements[1:])
+
+def test_folder_tree_rejects_negative_depth(monkeypatch):
+    response, statements = call(monkeypatch, "GET", "/folders/a/tree", params={"max_depth": -1})
+    assert response.status_code == 422
+    assert statements == []
@@ -0,0 +1,48 @@
+import json
+from datetime import date, datetime
+
+import pytest
+from fastapi import HTTPException
+from fastapi.encoders import jsonable_encoder
+
+import main
+from main import Donation, DonationCreate, request_fingerprint, store_idempotent_response
+
+class RecordingCursor:
+    def __init__(self):
+        self.stored = None
+
+    def execute(self, query, params):
+        self.stored = json.loads(params[0])
+
+def donation(**overrides):
+    fields = dict(donor_name="donor", amount=250000.0, payment_method="cash", date=date(2024, 5, 1))
+    fields.update(overrides)
+    return DonationCreate(**fields)
+
+def test_fingerprint_is_stable_and_content_sensitive():
+    assert request_fingerprint(donation()) == request_fingerprint(donation())
+    assert request_fingerprint(donation()) != request_fingerprint(donation(amount=250001.0))
+
+def test_stored_response_has_the_response_model_shape():
+    result = {
+        "id": 1, "donor_name": "donor", "amount": 250000, "payment_method": "cash",
+        "date": date(2024, 5, 1), "project": None, "notes": None, "status": "completed",
+        "created_at": datetime(2024, 5, 1, 9, 0), "unexpected": "column",
+    }
+    cursor = RecordingCursor()
+    stored = store_idempotent_response(cursor, "donations", "key-1", result, Donation)
+    first_response = jsonable_encoder(Donation(**result))
+    assert stored == cursor.stored == first_response
+    assert "unexpected" not in stored
+
+def test_replay_from_cache_and_mismatch():
+    fingerprint = request_fingerprint(donation())
+    main.remember_idempotent_response("donations", "key-2", fingerprint, {"id": 1})
+    replay = main.cached_idempotent_response("donations", "key-2", fingerprint)
+    assert replay.headers["Idempotent-Replayed"] == "true"
+    assert json.loads(replay.body) == {"id": 1}
+    with pytest.raises(HTTPException) as excinfo:
+        main.cached_idempotent_response("donations", "key-2", request_fingerprint(donation(amount=1.0)))
+    assert excinfo.value.status_code == 422
+    assert main.cached_idempotent_response("donations", None, fingerprint) is None
@@ -0,0 +1,66 @@
+import asyncio
+
+import main
+
+def make_hub():
+    hub = main.NotificationHub()
+    hub.listening = True
+    return hub
+
+def entry(last_read_id, count, snapshot="100:105:"):
+    return {"last_read_id": last_read_id, "count": count, "snapshot": snapshot}
+
+def test_xid_visible():
+    assert main._xid_visible(99, "100:105:")
+    assert main._xid_visible(102, "100:105:")
+    assert main._xid_visible(102, "100:105:101,103")
+    assert not main._xid_visible(101, "100:105:101,103")
+    assert not main._xid_visible(100, "100:105:100")
+    assert not main._xid_visible(105, "100:105:")
+    assert not main._xid_visible(200, "100:105:")
+
+def test_created_above_watermark_moves_count():
+    hub = make_hub()
+    hub.unread_counts["a"] = entry(10, 3)
+    hub._apply({"event": "created", "count": 2, "min_id": 11, "max_id": 12, "xid": 200})
+    assert hub.unread_counts["a"]["count"] == 5
+
+def test_event_already_in_the_count_is_skipped():
+    hub = make_hub()
+    hub.unread_counts["a"] = entry(10, 3, snapshot="100:105:")
+    hub._apply({"event": "created", "count": 2, "min_id": 11, "max_id": 12, "xid": 99})
+    assert hub.unread_counts["a"]["count"] == 3
+
+def test_unaccountable_changes_drop_the_entry():
+    hub = make_hub()
+    hub.unread_counts["a"] = entry(10, 3)
+    hub.unread_counts["b"] = entry(10, 3)
+    hub.unread_counts["c"] = entry(10, 3)
+    hub._apply({"event": "created", "count": 1, "min_id": 5, "max_id": 5, "xid": 200})
+    assert "a" not in hub.unread_counts
+    hub._apply({"event": "read", "reader": "b", "last_read_id": 20, "xid": 201})
+    assert "b" not in hub.unread_counts
+    hub._apply({"event": "deleted", "count": 1, "min_id": 11, "max_id": 11, "xid": 202})
+    assert "c" not in hub.unread_counts
+
+def test_reader_cache_is_bounded(monkeypatch):
+    async def fake_fetch(query, reader):
+        return [{"last_read_id": 0, "count": 1, "snapshot": "100:100:"}]
+
+    monkeypatch.setattr(main, "async_fetch", fake_fetch)
+    monkeypatch.setattr(main, "NOTIFY_READER_CACHE_SIZE", 3)
+    hub = make_hub()
+
+    async def read_all():
+        for reader in ("a", "b", "c", "a", "d"):
+            await hub.current_unread_count(reader)
+
+    asyncio.run(read_all())
+    assert list(hub.unread_counts) == ["c", "a", "d"]
+
+def test_slow_subscriber_gets_resync():
+    hub = make_hub()
+    queue = asyncio.Queue(maxsize=2)
+    for count in range(3):
+        hub._publish(queue, {"event": "created", "unread_count": count})
+    assert queue.get_nowait() == {"event": "resync", "unread_count": 2}
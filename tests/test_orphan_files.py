@@ -0,0 +1,45 @@
+import main
+
+class FakeConnection:
+    def __init__(self, locked):
+        self.locked = locked
+        self.statements = []
+
+    def cursor(self):
+        return self
+
+    def execute(self, query, params=None):
+        self.statements.append(" ".join(query.split()))
+
+    def fetchone(self):
+        if self.statements[-1].startswith("SELECT pg_try_advisory_lock"):
+            return (self.locked,)
+        return None
+
+    def fetchall(self):
+        return []
+
+    def commit(self):
+        pass
+
+    def rollback(self):
+        pass
+
+    def close(self):
+        pass
+
+def test_reconciler_skips_while_another_worker_holds_the_lock(monkeypatch):
+    conn = FakeConnection(locked=False)
+    monkeypatch.setattr(main, "get_db", lambda: conn)
+    assert main.reconcile_orphan_files() == {"action": main.ORPHAN_ACTION, "skipped": True}
+    assert conn.statements == ["SELECT pg_try_advisory_lock(%s)"]
+
+def test_reconciler_releases_its_lock(tmp_path, monkeypatch):
+    conn = FakeConnection(locked=True)
+    monkeypatch.setattr(main, "get_db", lambda: conn)
+    monkeypatch.setattr(main, "UPLOAD_DIR", str(tmp_path))
+    monkeypatch.setattr(main, "ORPHAN_QUARANTINE_DIR", tmp_path / "quarantine")
+    stats = main.reconcile_orphan_files()
+    assert stats["completed_pass"] and "skipped" not in stats
+    assert conn.statements[0] == "SELECT pg_try_advisory_lock(%s)"
+    assert conn.statements[-1] == "SELECT pg_advisory_unlock(%s)"
@@ -0,0 +1,70 @@
+import base64
+import json
+from datetime import date, datetime
+
+import pytest
+from fastapi import HTTPException
+
+from main import decode_cursor, encode_cursor, keyset_condition, nulls_low, page_limit, split_page
+
+def raw_cursor(payload):
+    return base64.urlsafe_b64encode(json.dumps(payload).encode()).decode().rstrip("=")
+
+def test_round_trip_parses_sort_value():
+    stamp = datetime(2024, 3, 1, 12, 30, 5, 250000)
+    assert decode_cursor(encode_cursor(stamp, 42), datetime) == (stamp, 42)
+    assert decode_cursor(encode_cursor(date(2024, 3, 1), 7), date) == (date(2024, 3, 1), 7)
+    assert decode_cursor(encode_cursor("donor-1", 3), str) == ("donor-1", 3)
+    assert decode_cursor(encode_cursor(None, 9), None) == (None, 9)
+
+@pytest.mark.parametrize("cursor, sort_type", [
+    ("not base64!", datetime),
+    (base64.urlsafe_b64encode(b"not json").decode(), datetime),
+    (raw_cursor([1, 2, 3]), datetime),
+    (raw_cursor(["yesterday", 1]), datetime),
+    (raw_cursor(["2024-01-01T10:00:00", 1]), date),
+    (raw_cursor([17, 1]), datetime),
+    (raw_cursor([17, 1]), str),
+    (raw_cursor([None, 1]), str),
+    (raw_cursor(["2024-01-01", "abc"]), date),
+    (raw_cursor(["2024-01-01", None]), date),
+])
+def test_malformed_cursor_is_a_400(cursor, sort_type):
+    with pytest.raises(HTTPException) as excinfo:
+        decode_cursor(cursor, sort_type)
+    assert excinfo.value.status_code == 400
+
+def test_split_page_trims_look_ahead_row():
+    rows = [(i, datetime(2024, 1, 1, 0, 0, 10 - i)) for i in range(1, 5)]
+    page, next_cursor = split_page(rows, 3, 1, 0)
+    assert page == rows[:3]
+    assert decode_cursor(next_cursor, datetime) == (rows[2][1], rows[2][0])
+
+def test_split_page_last_page_has_no_cursor():
+    rows = [(1, "a"), (2, "b")]
+    assert split_page(rows, 2, 1, 0) == (rows, None)
+
+def test_split_page_id_only():
+    page, next_cursor = split_page([(1,), (2,), (3,)], 2, None, 0)
+    assert page == [(1,), (2,)]
+    assert decode_cursor(next_cursor, None) == (None, 2)
+
+def test_page_ending_on_null_sort_key_continues():
+    rows = [(5, datetime(2024, 1, 1)), (4, None), (3, None), (2, None)]
+    page, next_cursor = split_page(rows, 2, 1, 0)
+    after = decode_cursor(next_cursor, datetime)
+    assert after == (None, 4)
+    # NULL rows sort as '-infinity', so the next page is the NULL rows with a lower id
+    assert keyset_condition(nulls_low("created_at"), "id", after) == (
+        "(COALESCE(created_at, '-infinity'), id) < ('-infinity', %s)", [4]
+    )
+    stamp = datetime(2024, 1, 1)
+    assert keyset_condition(nulls_low("created_at"), "id", (stamp, 5)) == (
+        "(COALESCE(created_at, '-infinity'), id) < (%s, %s)", [stamp, 5]
+    )
+
+def test_page_limit_bounds():
+    assert page_limit(None) > 0
+    assert page_limit(10 ** 9) < 10 ** 9
+    with pytest.raises(HTTPException):
+        page_limit(0)
@@ -0,0 +1,45 @@
+"""FastJSONResponse must put the same JSON on the wire as the response_model it bypasses."""
+import json
+from datetime import date, datetime
+from typing import List
+
+from pydantic import TypeAdapter
+
+from main import Activity, Donation, FastJSONResponse, Payment, rows_to_dicts
+
+class FakeCursor:
+    def __init__(self, columns):
+        self.description = [(name,) for name in columns]
+
+def assert_same_wire_format(model, columns, rows):
+    dicts = rows_to_dicts(FakeCursor(columns), rows)
+    fast = json.loads(FastJSONResponse(dicts).body)
+    adapter = TypeAdapter(List[model])
+    validated = adapter.dump_python(adapter.validate_python(dicts), mode="json")
+    assert fast == validated
+
+def test_payment_history_rows():
+    columns = ("id", "employee_id", "employee_name", "amount", "payment_period", "description",
+               "payment_method", "status", "remarks", "created_at", "approved_at", "processed_by")
+    rows = [
+        (1, 7, "employee-7", 1500.5, "2024-01", "monthly pay", "bank", "approved", None,
+         datetime(2024, 1, 2, 9, 30, 15, 123456), datetime(2024, 1, 3, 10, 0), 1),
+        (2, 8, "employee-8", 900.0, "2024-01", None, "cash", "pending", None,
+         datetime(2024, 1, 4, 8, 0), None, None),
+    ]
+    assert_same_wire_format(Payment, columns, rows)
+
+def test_donation_rows():
+    columns = ("id", "donor_name", "amount", "payment_method", "date", "project", "notes",
+               "status", "created_at", "donor_id")
+    rows = [(3, "donor", 250000.0, "cash", date(2024, 5, 1), None, None, "completed",
+             datetime(2024, 5, 1, 12, 0, 1), None)]
+    assert_same_wire_format(Donation, columns, rows)
+
+def test_activity_rows_with_formatted_created_at():
+    columns = ("id", "name", "project_id", "project_name", "description", "start_date",
+               "end_date", "budget", "status", "created_at")
+    # created_at as the route's to_char() formats it
+    rows = [(4, "activity", 1, "project", None, "2024-02-01", "2024-03-01", 100.0, "planned",
+             "2024-01-15T08:05:09")]
+    assert_same_wire_format(Activity, columns, rows)
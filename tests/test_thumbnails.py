@@ -0,0 +1,51 @@
+from concurrent.futures import Future
+
+import pytest
+from fastapi.testclient import TestClient
+
+import main
+
+class FakePool:
+    def __init__(self):
+        self.submitted = []
+
+    def submit(self, fn, file_path, file_type):
+        future = Future()
+        self.submitted.append((file_path, future))
+        return future
+
+@pytest.fixture
+def pool(monkeypatch):
+    pool = FakePool()
+    monkeypatch.setattr(main, "get_rendition_pool", lambda: pool)
+    monkeypatch.setattr(main, "_renders_in_flight", {})
+    monkeypatch.setattr(main, "_render_failures", {})
+    return pool
+
+def test_renders_in_flight_are_shared(pool, tmp_path):
+    image = tmp_path / "a.jpg"
+    first = main.submit_render(image, "image/jpeg")
+    assert main.submit_render(image, "image/jpeg") is first
+    main.schedule_renditions([(image, "image/jpeg")])
+    assert len(pool.submitted) == 1
+
+    first.set_result([])
+    main.submit_render(image, "image/jpeg")
+    assert len(pool.submitted) == 2
+
+def test_failed_render_is_a_415_and_not_retried(pool, tmp_path, monkeypatch):
+    monkeypatch.setattr(main, "can_render", lambda file_type: True)
+    monkeypatch.setattr(main, "RENDITION_TIMEOUT", 0.01)
+    image = tmp_path / "broken.heic"
+    image.write_bytes(b"not an image")
+    monkeypatch.setattr(main, "get_file_meta", lambda file_id: ("broken.heic", str(image), "image/heic", None))
+
+    client = TestClient(main.app)
+    assert client.get("/files/f/thumbnail").status_code == 503
+    pool.submitted[0][1].set_exception(OSError("cannot identify image file"))
+    assert main.render_failure(image) == "cannot identify image file"
+
+    for _ in range(3):
+        assert client.get("/files/f/thumbnail").status_code == 415
+    main.schedule_renditions([(image, "image/heic")])
+    assert len(pool.submitted) == 1
@@ -0,0 +1,31 @@
+import pytest
+from fastapi.testclient import TestClient
+
+import main
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setattr(main, "UPLOAD_MAX_REQUEST_BYTES", 1000)
+    def no_db():
+        raise AssertionError("oversized upload reached the endpoint")
+    monkeypatch.setattr(main, "get_db", no_db)
+    return TestClient(main.app)
+
+def test_rejects_oversized_content_length(client):
+    response = client.post("/upload/", files={"files": ("a.txt", b"x" * 5000)})
+    assert response.status_code == 413
+
+def test_rejects_oversized_chunked_body(client):
+    def body():
+        yield b"--b\r\n"
+        yield b"x" * 3000
+    response = client.post(
+        "/upload/", content=body(),
+        headers={"content-type": "multipart/form-data; boundary=b"}
+    )
+    assert response.status_code == 413
+
+def test_ignores_non_multipart_bodies(client):
+    # Passes the middleware and fails form validation instead
+    response = client.post("/upload/", json={"name": "x" * 5000})
+    assert response.status_code == 422
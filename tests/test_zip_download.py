@@ -0,0 +1,74 @@
+import io
+import zipfile
+
+from fastapi.testclient import TestClient
+
+import main
+
+def test_iter_zip_round_trips(tmp_path, monkeypatch):
+    monkeypatch.setattr(main, "UPLOAD_CHUNK_SIZE", 1024)
+    notes = tmp_path / "notes.txt"
+    notes.write_bytes(b"line\n" * 2000)
+    report = tmp_path / "report.pdf"
+    report.write_bytes(bytes(range(256)) * 20)
+
+    chunks = list(main.iter_zip(
+        ["Docs", "Docs/Sub"],
+        [("Docs/notes.txt", str(notes), "text/plain"),
+         ("Docs/Sub/report.pdf", str(report), "application/pdf"),
+         ("Docs/gone.txt", str(tmp_path / "missing.txt"), "text/plain")]
+    ))
+    assert len(chunks) > 2  # emitted while writing, not all at the end
+
+    with zipfile.ZipFile(io.BytesIO(b"".join(chunks))) as archive:
+        assert archive.testzip() is None
+        assert archive.namelist() == ["Docs/", "Docs/Sub/", "Docs/notes.txt", "Docs/Sub/report.pdf"]
+        assert archive.read("Docs/notes.txt") == notes.read_bytes()
+        assert archive.read("Docs/Sub/report.pdf") == report.read_bytes()
+        assert archive.getinfo("Docs/notes.txt").compress_type == zipfile.ZIP_DEFLATED
+        assert archive.getinfo("Docs/Sub/report.pdf").compress_type == zipfile.ZIP_STORED
+
+def test_iter_zip_empty_folder():
+    with zipfile.ZipFile(io.BytesIO(b"".join(main.iter_zip(["Empty"], [])))) as archive:
+        assert archive.namelist() == ["Empty/"]
+
+def test_zip_names():
+    assert main._zip_name("a/b\\c") == "a_b_c"
+    assert main._zip_name("") == "_"
+    taken = set()
+    assert [main._unique_name(name, taken) for name in ("a.txt", "a.txt", "a.txt", "b")] == \
+        ["a.txt", "a (2).txt", "a (3).txt", "b"]
+
+class FakeConnection:
+    def __init__(self, results):
+        self.statements = []
+        self.results = list(results)
+
+    def cursor(self):
+        return self
+
+    def execute(self, query, params=None):
+        self.statements.append(" ".join(query.split()))
+
+    def fetchone(self):
+        return ("/a/", 0)
+
+    def fetchall(self):
+        return self.results.pop(0)
+
+    def close(self):
+        pass
+
+def test_download_skips_rows_whose_folder_is_not_listed(tmp_path, monkeypatch):
+    kept = tmp_path / "kept.txt"
+    kept.write_bytes(b"kept")
+    conn = FakeConnection([
+        [("a", "A", None, "/a/"), ("b", "B", "a", "/a/b/"), ("c", "C", "moved-in", "/a/m/c/")],
+        [("kept.txt", str(kept), "text/plain", "b"), ("orphan.txt", str(kept), "text/plain", "new")],
+    ])
+    monkeypatch.setattr(main, "get_db", lambda: conn)
+    response = TestClient(main.app).get("/folders/a/download.zip")
+    assert response.status_code == 200
+    assert conn.statements[0] == "SET TRANSACTION ISOLATION LEVEL REPEATABLE READ"
+    with zipfile.ZipFile(io.BytesIO(response.content)) as archive:
+        assert archive.namelist() == ["B/", "B/kept.txt"]
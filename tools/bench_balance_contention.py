@@ -0,0 +1,81 @@
+"""Fire parallel sales and expenses at a running server and check the balance.
+
+Every request moves the main bank balance: a sale adds its total and an expense
+subtracts cost * quantity. Once all requests finish, the balance must equal the
+starting balance plus the sum of the successful writes. With the old
+read-modify-write updates, concurrent requests overwrote each other and the
+final balance drifted. Sales use service items so no stock is needed.
+
+This writes real rows. Point BENCH_URL at a scratch instance:
+
+    BENCH_URL=http://localhost:8000 BENCH_WORKERS=32 BENCH_REQUESTS=2000 \\
+        python tools/bench_balance_contention.py
+"""
+import json
+import os
+import random
+import sys
+import time
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+
+BASE_URL = os.getenv("BENCH_URL", "http://localhost:8000").rstrip("/")
+WORKERS = int(os.getenv("BENCH_WORKERS", "32"))
+REQUESTS = int(os.getenv("BENCH_REQUESTS", "2000"))
+
+def call(method, path, body=None):
+    data = json.dumps(body).encode() if body is not None else None
+    request = urllib.request.Request(BASE_URL + path, data=data, method=method,
+                                     headers={"Content-Type": "application/json"})
+    with urllib.request.urlopen(request, timeout=60) as response:
+        return json.loads(response.read())
+
+def get_balance():
+    return call("GET", "/bank_account/")["balance"]
+
+def one_write(i):
+    """Send one sale or expense; return its signed balance delta, or None on failure."""
+    amount = random.randint(1, 500)
+    try:
+        if i % 2 == 0:
+            call("POST", "/sales/", {
+                "client_name": f"bench-{i}",
+                "items": [{"name": "bench-service", "type": "service", "quantity": 1,
+                           "unit_price": amount, "total": amount}],
+                "total_amount": amount,
+            })
+            return amount
+        call("POST", "/expenses/", {
+            "date": date.today().isoformat(), "person": "bench", "description": f"bench-{i}",
+            "cost": amount, "quantity": 1,
+        })
+        return -amount
+    except Exception as e:
+        print(f"request {i} failed: {e}", file=sys.stderr)
+        return None
+
+def main():
+    start_balance = get_balance()
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=WORKERS) as pool:
+        deltas = list(pool.map(one_write, range(REQUESTS)))
+    elapsed = time.perf_counter() - started
+
+    applied = [d for d in deltas if d is not None]
+    expected = start_balance + sum(applied)
+    final_balance = get_balance()
+
+    print(f"{len(applied)}/{REQUESTS} writes in {elapsed:.2f}s with {WORKERS} workers "
+          f"({len(applied) / elapsed:,.0f} writes/s)")
+    print(f"start {start_balance:.2f}  expected {expected:.2f}  final {final_balance:.2f}")
+    # balance is REAL (float4), so each write may round by up to half an ulp
+    tolerance = 0.01 + len(applied) * max(abs(start_balance), abs(expected)) * 2 ** -24
+    if abs(final_balance - expected) > tolerance:
+        print(f"MISMATCH: lost {expected - final_balance:.2f}", file=sys.stderr)
+        return 1
+    print("balance consistent")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
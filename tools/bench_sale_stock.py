@@ -0,0 +1,77 @@
+"""Time the stock step of a sale with 1, 10 and 100 line items.
+
+Compares the old per-item loop (SELECT then UPDATE per product, 2N round trips)
+with decrement_stock() (one statement for the whole sale). Seeds its own stock
+rows and rolls everything back, but point BENCH_DATABASE_URL at a scratch
+database that has been migrated with `python main.py migrate`.
+
+    BENCH_DATABASE_URL=postgresql://localhost/man_check python tools/bench_sale_stock.py
+"""
+import os
+import sys
+import time
+
+import psycopg2
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from main import SaleItem, decrement_stock
+
+LINE_COUNTS = (1, 10, 100)
+SALES = int(os.getenv("BENCH_SALES", "200"))
+
+def old_decrement(cursor, items):
+    stock_value_sold = 0
+    for item in items:
+        if item.type == "product":
+            cursor.execute('SELECT * FROM stock WHERE product_name = %s', (item.name,))
+            stock_item = cursor.fetchone()
+            if not stock_item or stock_item[3] < item.quantity:
+                raise RuntimeError(f"stock check failed for {item.name}")
+            cursor.execute('''
+                UPDATE stock
+                SET quantity = quantity - %s
+                WHERE product_name = %s
+                RETURNING price_per_unit
+            ''', (item.quantity, item.name))
+            stock_value_sold += sum(item.quantity * row[0] for row in cursor.fetchall())
+    return stock_value_sold
+
+def make_items(lines):
+    return [SaleItem(name=f"bench-product-{i}", type="product", quantity=1, unit_price=150, total=150)
+            for i in range(lines)]
+
+def main():
+    dsn = os.getenv("BENCH_DATABASE_URL")
+    if not dsn:
+        print("Set BENCH_DATABASE_URL to a scratch database", file=sys.stderr)
+        return 2
+
+    conn = psycopg2.connect(dsn)
+    try:
+        cursor = conn.cursor()
+        cursor.execute('''
+            INSERT INTO stock (product_name, product_type, quantity, price_per_unit)
+            SELECT 'bench-product-' || g, 'bench', %s, 150 FROM generate_series(0, %s) g
+        ''', (SALES * 10, max(LINE_COUNTS) - 1))
+        cursor.execute('ANALYZE stock')
+
+        print(f"{SALES} sales per run")
+        for lines in LINE_COUNTS:
+            items = make_items(lines)
+            timings = {}
+            for name, func in (("per-item", old_decrement), ("set-based", decrement_stock)):
+                started = time.perf_counter()
+                for _ in range(SALES):
+                    func(cursor, items)
+                timings[name] = (time.perf_counter() - started) / SALES
+            print(f"{lines:4} lines  per-item {timings['per-item'] * 1000:8.2f} ms  "
+                  f"set-based {timings['set-based'] * 1000:8.2f} ms  "
+                  f"({timings['per-item'] / timings['set-based']:.1f}x)")
+    finally:
+        conn.rollback()
+        conn.close()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
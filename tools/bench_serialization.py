@@ -0,0 +1,72 @@
+"""Compare the old and new row-to-JSON paths on a large payment history response.
+
+The old path is what /payments/history did before: rebuild the column list for
+every row, then let FastAPI validate each dict against the Payment response
+model, run jsonable_encoder and json.dumps. The new path maps rows with
+rows_to_dicts and renders them with FastJSONResponse. No database is needed;
+rows are synthesized with the shape psycopg2 returns.
+
+    python tools/bench_serialization.py            # 100k rows
+    BENCH_ROWS=500000 python tools/bench_serialization.py
+"""
+import json
+import os
+import sys
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from fastapi.encoders import jsonable_encoder
+
+from main import FastJSONResponse, Payment, orjson, rows_to_dicts
+
+ROWS = int(os.getenv("BENCH_ROWS", "100000"))
+REPEAT = int(os.getenv("BENCH_REPEAT", "3"))
+
+COLUMNS = ("id", "employee_id", "employee_name", "amount", "payment_period", "description",
+           "payment_method", "status", "remarks", "created_at", "approved_at", "processed_by")
+
+class FakeCursor:
+    description = [(name,) for name in COLUMNS]
+
+def make_rows(n):
+    start = datetime(2024, 1, 1)
+    return [
+        (i, i % 500, f"employee-{i % 500}", 1500.0 + i % 100, "2024-01", "monthly pay",
+         "bank", "approved", None, start + timedelta(minutes=i), start + timedelta(minutes=i, hours=1), 1)
+        for i in range(n)
+    ]
+
+def old_path(cursor, rows):
+    dicts = [dict(zip([col[0] for col in cursor.description], row)) for row in rows]
+    validated = [Payment(**row) for row in dicts]
+    return json.dumps(jsonable_encoder(validated)).encode("utf-8")
+
+def new_path(cursor, rows):
+    return FastJSONResponse(rows_to_dicts(cursor, rows)).body
+
+def best_of(func, *args):
+    best = None
+    for _ in range(REPEAT):
+        started = time.perf_counter()
+        body = func(*args)
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best, len(body)
+
+def main():
+    cursor = FakeCursor()
+    rows = make_rows(ROWS)
+    print(f"{ROWS} rows, best of {REPEAT}, encoder: {'orjson' if orjson else 'json'}")
+
+    results = {}
+    for name, func in (("old", old_path), ("new", new_path)):
+        elapsed, size = best_of(func, cursor, rows)
+        results[name] = elapsed
+        print(f"{name:4} {elapsed:8.3f}s  {ROWS / elapsed:12,.0f} rows/s  {size / 1e6:7.1f} MB")
+
+    print(f"speedup: {results['old'] / results['new']:.1f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,182 @@
+"""Fail if any route query plans a sequential scan.
+
+Seeds every table touched by the route queries below, ANALYZEs them and runs
+EXPLAIN on each query with sequential scans disabled, so a remaining
+"Seq Scan" node means no index can serve that access path. Everything runs
+inside one transaction that is rolled back, but point CHECK_DATABASE_URL at a
+scratch database that has been migrated with `python main.py migrate`.
+
+    CHECK_DATABASE_URL=postgresql://localhost/man_check python tools/check_query_plans.py
+"""
+import json
+import os
+import sys
+
+import psycopg2
+
+SEED_ROWS = int(os.getenv("CHECK_SEED_ROWS", "5000"))
+
+SEED_SQL = '''
+    INSERT INTO products (name, type, buying_price, selling_price)
+    SELECT 'product-' || g, 'type-' || (g %% 10), 100, 150 FROM generate_series(1, %(n)s) g;
+
+    INSERT INTO stock (product_name, product_type, quantity, price_per_unit)
+    SELECT 'product-' || g, 'type-' || (g %% 10), 50, 150 FROM generate_series(1, %(n)s) g;
+
+    INSERT INTO sales (client_name, items, total_amount, created_at)
+    SELECT 'client-' || g, '[]'::jsonb, 1000, now() - (g || ' minutes')::interval
+    FROM generate_series(1, %(n)s) g;
+
+    INSERT INTO notifications (message, type, created_at, is_read)
+    SELECT 'message ' || g, 'sale', now() - (g || ' minutes')::interval, g %% 50 <> 0
+    FROM generate_series(1, %(n)s) g;
+
+    INSERT INTO donors (name) SELECT 'donor-' || g FROM generate_series(1, %(n)s) g;
+
+    INSERT INTO donations (donor_id, donor_name, amount, payment_method, date)
+    SELECT d.id, d.name, 500, 'cash', current_date - (d.id %% 365)
+    FROM donors d;
+
+    INSERT INTO employees (name, nin, dob, qualification)
+    SELECT 'employee-' || g, 'check-nin-' || g, '1990-01-01', 'diploma'
+    FROM generate_series(1, %(n)s) g;
+
+    INSERT INTO projects (name, start_date, end_date, budget, funding_source, status)
+    SELECT 'project-' || g, current_date, current_date + 30, 1000, 'grant', 'planned'
+    FROM generate_series(1, %(n)s) g;
+
+    INSERT INTO activities (name, project_id, start_date, end_date, budget, status)
+    SELECT 'activity-' || p.id, p.id, current_date, current_date + 30, 100, 'planned'
+    FROM projects p;
+
+    INSERT INTO budget_items (project_id, activity_id, item_name, quantity, unit_price, category)
+    SELECT a.project_id, a.id, 'item-' || a.id, 1, 10, 'supplies' FROM activities a;
+
+    INSERT INTO payments (employee_id, amount, payment_period, payment_method, status, created_at)
+    SELECT e.id, 100, '2024-01', 'cash',
+           CASE WHEN e.id %% 20 = 0 THEN 'pending' ELSE 'approved' END,
+           now() - (e.id || ' minutes')::interval
+    FROM employees e;
+
+    INSERT INTO reports (employee_id, activity_id, title, content, status, created_at)
+    SELECT (SELECT MIN(id) FROM employees), a.id, 'report', 'content',
+           CASE WHEN a.id %% 10 = 0 THEN 'submitted' ELSE 'approved' END,
+           now() - (a.id || ' minutes')::interval
+    FROM activities a;
+
+    INSERT INTO folders (id, name, parent_id)
+    SELECT 'check-folder-' || g, 'folder', 'root' FROM generate_series(1, %(n)s) g;
+
+    INSERT INTO files (id, name, type, size, folder_id, path)
+    SELECT 'check-file-' || g, 'file', 'application/pdf', 1, 'check-folder-' || g, '/dev/null'
+    FROM generate_series(1, %(n)s) g;
+'''
+
+# (route, query, params) - the WHERE/ORDER BY shape each route sends
+ROUTE_QUERIES = [
+    ("GET /products/{name}/{type}",
+     "SELECT * FROM products WHERE name = %s AND type = %s", ("product-7", "type-7")),
+    ("PUT /stock/{name}/{type}",
+     "SELECT * FROM stock WHERE product_name = %s AND product_type = %s", ("product-7", "type-7")),
+    ("POST /sales/ stock check",
+     "SELECT * FROM stock WHERE product_name = %s", ("product-7",)),
+    ("GET /sales/?date=",
+     "SELECT * FROM sales WHERE created_at >= current_date AND created_at < current_date + 1 "
+     "ORDER BY created_at DESC", ()),
+    ("GET /notifications/unread/ watermark",
+     "SELECT COALESCE(MAX(last_read_id), 0) FROM notification_read_marks WHERE reader = %s", ("default",)),
+    ("GET /notifications/unread/",
+     "SELECT COUNT(*) FROM notifications WHERE id > %s", (SEED_ROWS // 2,)),
+    ("GET /sales/?cursor=",
+     "SELECT * FROM sales WHERE (COALESCE(created_at, '-infinity'), id) < (now(), 1000000) "
+     "ORDER BY COALESCE(created_at, '-infinity') DESC, id DESC LIMIT 101", ()),
+    ("GET /notifications/",
+     "SELECT * FROM notifications WHERE (COALESCE(created_at, '-infinity'), id) < (now(), 1000000) "
+     "ORDER BY COALESCE(created_at, '-infinity') DESC, id DESC LIMIT 101", ()),
+    ("GET /donors/{id}/donations",
+     "SELECT id, date, amount FROM donations WHERE donor_id = (SELECT MIN(id) FROM donors) "
+     "ORDER BY date DESC, id DESC", ()),
+    ("POST /donations/ donor lookup",
+     "SELECT id FROM donors WHERE name = %s LIMIT 2", ("donor-7",)),
+    ("POST /donors/ link unmatched donations",
+     "SELECT id FROM donations WHERE donor_id IS NULL AND donor_name = %s", ("donor-7",)),
+    ("GET /donations/",
+     "SELECT * FROM donations WHERE (date, id) < (current_date, 1000000) "
+     "ORDER BY date DESC, id DESC LIMIT 101", ()),
+    ("GET /donors/",
+     "SELECT id FROM donors WHERE (name, id) > ('donor-1', 1) ORDER BY name, id LIMIT 101", ()),
+    ("GET /payments/pending",
+     "SELECT p.id FROM payments p JOIN employees e ON p.employee_id = e.id "
+     "WHERE p.status = 'pending' ORDER BY p.created_at DESC", ()),
+    ("GET /payments/history?status=",
+     "SELECT p.id FROM payments p WHERE p.status = %s "
+     "AND (COALESCE(p.created_at, '-infinity'), p.id) < (now(), 1000000) "
+     "ORDER BY COALESCE(p.created_at, '-infinity') DESC, p.id DESC LIMIT 101", ("approved",)),
+    ("GET /payments/employee/{id}",
+     "SELECT p.id FROM payments p WHERE p.employee_id = (SELECT MIN(id) FROM employees) "
+     "ORDER BY p.created_at DESC", ()),
+    ("GET /director/reports/",
+     "SELECT r.id FROM reports r WHERE r.status = %s ORDER BY r.created_at DESC LIMIT 10", ("submitted",)),
+    ("GET /director/reports/?activity_id=",
+     "SELECT r.id FROM reports r WHERE r.activity_id = (SELECT MIN(id) FROM activities) "
+     "ORDER BY r.created_at DESC", ()),
+    ("GET /reports/",
+     "SELECT r.id FROM reports r ORDER BY COALESCE(r.created_at, '-infinity') DESC, r.id DESC LIMIT 101", ()),
+    ("GET /folders/{id}/contents files",
+     "SELECT id, name, type, size FROM files WHERE folder_id = %s", ("check-folder-7",)),
+    ("GET /folders/{id}/contents folders",
+     "SELECT id, name, parent_id FROM folders WHERE parent_id = %s", ("check-folder-7",)),
+    ("GET /folders/{id}/tree",
+     "SELECT id FROM folders WHERE path LIKE %s || '%%'", ("/root/check-folder-7/",)),
+    ("GET /activities/{id}/budget-items/",
+     "SELECT id FROM budget_items WHERE activity_id = (SELECT MIN(id) FROM activities) "
+     "ORDER BY created_at DESC", ()),
+    ("GET /budget-items/{project_id}",
+     "SELECT id FROM budget_items WHERE project_id = (SELECT MIN(id) FROM projects) "
+     "ORDER BY created_at DESC", ()),
+]
+
+def find_seq_scans(plan, found=None):
+    if found is None:
+        found = []
+    if plan.get("Node Type") == "Seq Scan":
+        found.append(plan.get("Relation Name"))
+    for child in plan.get("Plans", []):
+        find_seq_scans(child, found)
+    return found
+
+def main():
+    dsn = os.getenv("CHECK_DATABASE_URL")
+    if not dsn:
+        print("Set CHECK_DATABASE_URL to a scratch database", file=sys.stderr)
+        return 2
+
+    conn = psycopg2.connect(dsn)
+    failures = []
+    try:
+        cursor = conn.cursor()
+        cursor.execute(SEED_SQL, {"n": SEED_ROWS})
+        cursor.execute('ANALYZE')
+        cursor.execute('SET LOCAL enable_seqscan = off')
+
+        for route, query, params in ROUTE_QUERIES:
+            cursor.execute('EXPLAIN (FORMAT JSON) ' + query, params)
+            plan = cursor.fetchone()[0]
+            if isinstance(plan, str):
+                plan = json.loads(plan)
+            seq_scans = find_seq_scans(plan[0]["Plan"])
+            status = "FAIL" if seq_scans else "ok"
+            print(f"{status:4}  {route}" + (f"  (seq scan on {', '.join(seq_scans)})" if seq_scans else ""))
+            if seq_scans:
+                failures.append(route)
+    finally:
+        conn.rollback()
+        conn.close()
+
+    if failures:
+        print(f"\n{len(failures)} route queries plan a sequential scan", file=sys.stderr)
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())